@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from flask import Flask, render_template, request
-from pydantic import ValidationError
 
-from gift_tax.calculator import GiftInput, LawContext, compute_tax, load_law_table
+from gift_tax.calculator import FormError, GiftInput, LawContext, compute_tax, load_law_table
 
 APP_ROOT = Path(__file__).resolve().parent
 LAW_TABLE_PATH = APP_ROOT / "gift_tax" / "law_tables" / "kor_2025.yaml"
@@ -50,51 +49,66 @@ def _empty_form_values() -> Dict[str, str]:
     }
 
 
-@app.route("/", methods=["GET"])
-def form() -> str:
+# The blank form never varies, so it is rendered once on the first GET and reused.
+_EMPTY_FORM_HTML: Optional[str] = None
+
+
+def _render_empty_form(
+    _REL: List[Tuple[str, str]] = RELATIONSHIP_OPTIONS,
+    _RES: List[Tuple[str, str]] = RESIDENCY_OPTIONS,
+    _PT: List[Tuple[str, str]] = PROPERTY_TYPE_OPTIONS,
+) -> str:
     return render_template(
         "form.html",
-        relationship_options=RELATIONSHIP_OPTIONS,
-        residency_options=RESIDENCY_OPTIONS,
-        property_type_options=PROPERTY_TYPE_OPTIONS,
+        relationship_options=_REL,
+        residency_options=_RES,
+        property_type_options=_PT,
         errors=[],
         form_values=_empty_form_values(),
     )
 
 
+@app.route("/", methods=["GET"])
+def form() -> str:
+    global _EMPTY_FORM_HTML
+
+    if app.debug:
+        return _render_empty_form()
+    if _EMPTY_FORM_HTML is None:
+        _EMPTY_FORM_HTML = _render_empty_form()
+    return _EMPTY_FORM_HTML
+
+
 @app.route("/calc", methods=["POST"])
-def calculate() -> str:
-    form_data = request.form.to_dict()
-    payload = {
-        "recipient_name": form_data.get("recipient_name", ""),
-        "gift_date": form_data.get("gift_date", ""),
-        "relationship": form_data.get("relationship", ""),
-        "residency_status": form_data.get("residency_status", ""),
-        "property_type": form_data.get("property_type", ""),
-        "property_value": form_data.get("property_value", ""),
-        "debt_assumed": form_data.get("debt_assumed", ""),
-        "prior_gifts": form_data.get("prior_gifts", ""),
-    }
+def calculate(
+    _REL: List[Tuple[str, str]] = RELATIONSHIP_OPTIONS,
+    _RES: List[Tuple[str, str]] = RESIDENCY_OPTIONS,
+    _PT: List[Tuple[str, str]] = PROPERTY_TYPE_OPTIONS,
+    _LAW: LawContext = LAW_CONTEXT,
+) -> str:
+    # Module constants are bound as defaults so the handler reads them as locals.
+    # GiftInput.from_form reads each field with .get(), so the form is passed through as-is.
+    form_data = request.form
 
     try:
-        gift_input = GiftInput(**payload)
-    except ValidationError as exc:
+        gift_input = GiftInput.from_form(form_data)
+    except FormError as exc:
         error_messages = [
-            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+            f"{loc[0] if len(loc) == 1 else '.'.join(map(str, loc))}: {msg}" for loc, msg in exc.errors
         ]
         return (
             render_template(
                 "form.html",
-                relationship_options=RELATIONSHIP_OPTIONS,
-                residency_options=RESIDENCY_OPTIONS,
-                property_type_options=PROPERTY_TYPE_OPTIONS,
+                relationship_options=_REL,
+                residency_options=_RES,
+                property_type_options=_PT,
                 errors=error_messages,
-                form_values=payload,
+                form_values=form_data,
             ),
             400,
         )
 
-    breakdown = compute_tax(gift_input, LAW_CONTEXT)
+    breakdown = compute_tax(gift_input, _LAW)
 
     return render_template("result.html", breakdown=breakdown)
 
@@ -1,8 +1,9 @@
 """Gift tax calculation utilities package."""
 
-from .calculator import GiftInput, GiftBreakdown, compute_tax, load_law_table
+from .calculator import FormError, GiftInput, GiftBreakdown, compute_tax, load_law_table
 
 __all__ = [
+    "FormError",
     "GiftInput",
     "GiftBreakdown",
     "compute_tax",
@@ -2,62 +2,139 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import date
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 
 import yaml
-from dateutil.parser import parse as parse_datetime
-from pydantic import BaseModel, Field, validator
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeLoader as _YamlLoader
 
-class GiftInput(BaseModel):
+
+class FormError(ValueError):
+    """Raised when a form submission cannot be converted into ``GiftInput``.
+
+    ``errors`` lists every invalid field as ``(loc, msg)`` where ``loc`` is a
+    tuple of field names.
+    """
+
+    def __init__(self, errors: list[Tuple[Tuple[str, ...], str]]) -> None:
+        super().__init__("; ".join(f"{'.'.join(loc)}: {msg}" for loc, msg in errors))
+        self.errors = errors
+
+
+_TEXT_FIELDS = ("recipient_name", "relationship", "residency_status", "property_type")
+_AMOUNT_FIELDS = ("property_value", "debt_assumed", "prior_gifts")
+# Amounts must stay below 10**16 won; larger inputs are rejected before int().
+_MAX_AMOUNT = Decimal(10) ** 16
+_MAX_AMOUNT_MESSAGE = f"{_MAX_AMOUNT - 1:,}원 이하의 값을 입력해 주세요."
+
+
+@dataclass(slots=True, frozen=True)
+class GiftInput:
     """Structured representation of the gift tax form submission."""
 
-    recipient_name: str = Field(..., description="수증자 이름")
-    gift_date: date = Field(..., description="증여일")
-    relationship: str = Field(..., description="증여자와의 관계")
-    residency_status: str = Field(..., description="거주자 여부")
-    property_type: str = Field(..., description="증여 재산 종류")
-    property_value: Decimal = Field(..., ge=0, description="평가가액")
-    debt_assumed: Optional[Decimal] = Field(default=Decimal("0"), ge=0, description="채무 인수액")
-    prior_gifts: Optional[Decimal] = Field(
-        default=Decimal("0"), ge=0, description="최근 10년 내 동일 증여자의 누적 증여가액"
-    )
+    recipient_name: str  # 수증자 이름
+    gift_date: date  # 증여일
+    relationship: str  # 증여자와의 관계
+    residency_status: str  # 거주자 여부
+    property_type: str  # 증여 재산 종류
+    property_value: int  # 평가가액 (원)
+    debt_assumed: int = 0  # 채무 인수액 (원)
+    prior_gifts: int = 0  # 최근 10년 내 동일 증여자의 누적 증여가액 (원)
+
+    @classmethod
+    def from_form(cls, payload: Mapping[str, Any]) -> GiftInput:
+        """Validate raw form values, raising ``FormError`` listing every invalid field."""
+
+        values: Dict[str, Any] = {}
+        errors: list[Tuple[Tuple[str, ...], str]] = []
+
+        for name in _TEXT_FIELDS:
+            try:
+                values[name] = cls.strip_strings(payload.get(name, ""))
+            except ValueError as exc:
+                errors.append(((name,), str(exc)))
 
-    @validator("recipient_name", "relationship", "residency_status", "property_type")
-    def strip_strings(cls, value: str) -> str:
+        try:
+            values["gift_date"] = cls.parse_date(payload.get("gift_date", ""))
+        except ValueError as exc:
+            errors.append((("gift_date",), str(exc)))
+
+        for name in _AMOUNT_FIELDS:
+            try:
+                amount = cls.parse_decimal(payload.get(name))
+            except ValueError as exc:
+                errors.append(((name,), str(exc)))
+                continue
+            if amount < 0:
+                errors.append(((name,), "0 이상의 값을 입력해 주세요."))
+                continue
+            if amount >= _MAX_AMOUNT:
+                errors.append(((name,), _MAX_AMOUNT_MESSAGE))
+                continue
+            # Amounts are kept as whole won; fractions of a won are truncated.
+            values[name] = int(amount)
+
+        if errors:
+            raise FormError(errors)
+        return cls(**values)
+
+    @staticmethod
+    def strip_strings(value: Any) -> str:
         if isinstance(value, str):
             value = value.strip()
         if not value:
             raise ValueError("값을 입력해 주세요.")
-        return value
+        return str(value)
 
-    @validator("gift_date", pre=True)
-    def parse_date(cls, value: Any) -> date:
+    @staticmethod
+    def parse_date(value: Any) -> date:
         if isinstance(value, date):
             return value
+        if isinstance(value, str):
+            try:
+                return date.fromisoformat(value.strip())
+            except ValueError:
+                pass
+        # Only non-ISO input needs the generic parser, so keep it off the import path.
+        from dateutil.parser import parse as parse_datetime
+
         try:
             parsed = parse_datetime(str(value)).date()
-        except (ValueError, TypeError) as exc:  # pragma: no cover - defensive
+        except (ValueError, TypeError, OverflowError) as exc:
             raise ValueError("YYYY-MM-DD 형식으로 입력해 주세요.") from exc
         return parsed
 
-    @validator("property_value", "debt_assumed", "prior_gifts", pre=True)
-    def parse_decimal(cls, value: Any) -> Decimal:
-        if value in (None, ""):
+    @staticmethod
+    def parse_decimal(value: Any) -> Decimal:
+        if value is None or value == "":
             return Decimal("0")
         if isinstance(value, Decimal):
-            return value
-        try:
-            return Decimal(str(value))
-        except (ValueError, TypeError) as exc:  # pragma: no cover - defensive
-            raise ValueError("숫자를 입력해 주세요.") from exc
-
-
-class GiftBreakdown(BaseModel):
+            amount = value
+        else:
+            try:
+                if isinstance(value, str):
+                    amount = Decimal(value.strip() or "0")
+                elif isinstance(value, int):
+                    amount = Decimal(value)
+                else:
+                    amount = Decimal(str(value))
+            except (ArithmeticError, ValueError, TypeError) as exc:
+                raise ValueError("숫자를 입력해 주세요.") from exc
+        if not amount.is_finite():
+            raise ValueError("숫자를 입력해 주세요.")
+        return amount
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class GiftBreakdown:
     """Outcome of the gift tax computation."""
 
     law_configured: bool
@@ -69,100 +146,189 @@ class GiftBreakdown(BaseModel):
     relationship: str
     residency_status: str
     property_type: str
-    property_value: Decimal
-    debt_assumed: Decimal
-    net_gift: Decimal
-    basic_deduction_limit: Decimal
-    prior_gifts_adjustment: Decimal
-    basic_deduction: Decimal
-    taxable_base: Decimal
+    property_value: int
+    debt_assumed: int
+    net_gift: int
+    basic_deduction_limit: int
+    prior_gifts_adjustment: int
+    basic_deduction: int
+    taxable_base: int
     applied_rate: Optional[Decimal] = None
-    progressive_deduction: Optional[Decimal] = None
-    tax_due: Optional[Decimal] = None
-    notes: list[str] = Field(default_factory=list)
+    progressive_deduction: Optional[int] = None
+    tax_due: Optional[int] = None
+    notes: list[str] = field(default_factory=list)
+
+
+class Bracket(NamedTuple):
+    """Progressive bracket normalized to whole won, with the rate as an exact fraction."""
 
+    min: int
+    max: Optional[int]  # None when the bracket is unbounded
+    rate: Decimal
+    rate_num: int
+    rate_den: int
+    deduction: int
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LawContext:
-    """Wrapper describing the loaded law table and whether it is usable."""
+    """Wrapper describing the loaded law table and whether it is usable.
+
+    Instances are shared through the load cache, so they are frozen and built
+    with all precomputed tables in ``load_law_table``.
+    """
 
     data: Optional[Dict[str, Any]]
     configured: bool
+    brackets: Tuple[Bracket, ...] = ()
+    min_edges: Tuple[int, ...] = ()
+    basic_deductions: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+
+# Resolved path -> (st_mtime_ns, st_size, LawContext); replaced when the file changes.
+_LAW_CACHE: Dict[str, Tuple[int, int, LawContext]] = {}
+
+
+def _contains_placeholder(raw_data: Any) -> bool:
+    """Return True if any string key or value in the parsed table mentions PLACEHOLDER."""
+
+    stack = [raw_data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if "PLACEHOLDER" in node:
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node.keys())
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return False
+
+
+def _to_won(value: Any) -> int:
+    """Convert a law table amount into whole won."""
+
+    return int(Decimal(str(value)))
+
+
+def _normalize_basic_deductions(raw_data: Dict[str, Any]) -> Dict[Tuple[str, str], int]:
+    """Flatten the basic deduction table into ``{(residency, relationship): limit}``."""
+
+    normalized: Dict[Tuple[str, str], int] = {}
+    basic_table = raw_data.get("basic_deduction") or {}
+    for residency_key, relationships in basic_table.items():
+        if not isinstance(relationships, dict):  # pragma: no cover - invalid config
+            continue
+        for relationship_key, limit in relationships.items():
+            try:
+                normalized[(residency_key, relationship_key)] = _to_won(limit)
+            except (ArithmeticError, ValueError, TypeError):  # pragma: no cover - invalid config
+                continue
+    return normalized
+
+
+def _normalize_brackets(raw_data: Dict[str, Any]) -> Tuple[Bracket, ...]:
+    """Convert the progressive rate table into brackets sorted by lower bound."""
+
+    normalized: list[Bracket] = []
+    for bracket in raw_data.get("progressive_rates") or []:
+        try:
+            min_value = _to_won(bracket.get("min", "0"))
+            max_value = bracket.get("max")
+            max_won = _to_won(max_value) if max_value is not None else None
+            rate = Decimal(str(bracket["rate"]))
+            rate_num, rate_den = rate.as_integer_ratio()
+            deduction = _to_won(bracket.get("deduction", "0"))
+        except (KeyError, ArithmeticError, ValueError, TypeError):  # pragma: no cover - invalid config
+            continue
+        normalized.append(Bracket(min_value, max_won, rate, rate_num, rate_den, deduction))
+
+    normalized.sort(key=lambda item: item.min)
+    return tuple(normalized)
 
 
 def load_law_table(path: str | Path) -> LawContext:
-    """Load the law table YAML file, detecting placeholder content."""
+    """Load the law table YAML file, detecting placeholder content.
+
+    Parsed tables are cached per resolved path together with the file's
+    modification time and size, so repeated loads of an unchanged file return
+    the same ``LawContext`` and a changed file replaces the cached entry.
+    """
 
     law_path = Path(path)
-    if not law_path.exists():
+    try:
+        stat = law_path.stat()
+    except FileNotFoundError:
         return LawContext(data=None, configured=False)
 
+    cache_key = str(law_path.resolve())
+    cached = _LAW_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
     with law_path.open("r", encoding="utf-8") as handle:
-        raw_data = yaml.safe_load(handle) or {}
+        raw_data = yaml.load(handle, Loader=_YamlLoader) or {}
 
-    serialized = yaml.safe_dump(raw_data)
-    contains_placeholder = "PLACEHOLDER" in serialized
+    contains_placeholder = _contains_placeholder(raw_data)
 
-    return LawContext(data=raw_data, configured=not contains_placeholder)
+    brackets = _normalize_brackets(raw_data)
+    law = LawContext(
+        data=raw_data,
+        configured=not contains_placeholder,
+        brackets=brackets,
+        min_edges=tuple(bracket.min for bracket in brackets),
+        basic_deductions=_normalize_basic_deductions(raw_data),
+    )
+    _LAW_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, law)
+    return law
 
 
-def _find_progressive_bracket(
-    brackets: Iterable[Dict[str, Any]], taxable_base: Decimal
-) -> Optional[Dict[str, Decimal]]:
+def _find_progressive_bracket(law: LawContext, taxable_base: int) -> Optional[Bracket]:
     """Locate the progressive tax bracket applicable to the taxable base."""
 
-    normalized: list[Dict[str, Decimal]] = []
-    for bracket in brackets:
-        try:
-            min_value = Decimal(str(bracket.get("min", "0")))
-            max_value = bracket.get("max")
-            max_decimal = Decimal(str(max_value)) if max_value is not None else None
-            rate = Decimal(str(bracket["rate"]))
-            deduction = Decimal(str(bracket.get("deduction", "0")))
-        except (KeyError, ValueError, TypeError):  # pragma: no cover - invalid config
-            continue
-        normalized.append(
-            {
-                "min": min_value,
-                "max": max_decimal,
-                "rate": rate,
-                "deduction": deduction,
-            }
-        )
+    index = bisect_right(law.min_edges, taxable_base) - 1
+    if index < 0:
+        return None
+
+    bracket = law.brackets[index]
+    if bracket.max is not None and taxable_base > bracket.max:
+        return None
+    return bracket
 
-    normalized.sort(key=lambda item: item["min"])
 
-    for bracket in normalized:
-        lower_ok = taxable_base >= bracket["min"]
-        upper_ok = bracket["max"] is None or taxable_base <= bracket["max"]
-        if lower_ok and upper_ok:
-            return bracket
+def _progressive_tax(bracket: Bracket, taxable_base: int) -> int:
+    """Apply the bracket rate and progressive deduction, rounding half up to the won."""
 
-    return None
+    num = bracket.rate_num
+    den = bracket.rate_den
+    raw_tax = (2 * taxable_base * num + den) // (2 * den)
+    tax = raw_tax - bracket.deduction
+    return tax if tax > 0 else 0
 
 
 def compute_tax(gift_input: GiftInput, law: LawContext) -> GiftBreakdown:
     """Compute the taxable base and optionally the tax, depending on law availability."""
 
     property_value = gift_input.property_value
-    debt_assumed = gift_input.debt_assumed or Decimal("0")
+    debt_assumed = gift_input.debt_assumed
     net_gift = property_value - debt_assumed
     if net_gift < 0:
-        net_gift = Decimal("0")
+        net_gift = 0
 
     law_version: Optional[str] = None
     law_reference: Optional[str] = None
     law_reference_url: Optional[str] = None
 
     notes: list[str] = []
-    tax_due: Optional[Decimal] = None
+    tax_due: Optional[int] = None
     applied_rate: Optional[Decimal] = None
-    progressive_deduction: Optional[Decimal] = None
+    progressive_deduction: Optional[int] = None
 
-    basic_deduction_limit = Decimal("0")
-    prior_gifts_adjustment = gift_input.prior_gifts or Decimal("0")
-    basic_deduction_applied = Decimal("0")
-    taxable_base = Decimal("0")
+    basic_deduction_limit = 0
+    prior_gifts_adjustment = gift_input.prior_gifts
+    basic_deduction_applied = 0
+    taxable_base = 0
 
     if not law.configured or not law.data:
         notes.append("법규 테이블이 설정되어 있지 않아 기본공제와 세액을 계산할 수 없습니다.")
@@ -175,12 +341,8 @@ def compute_tax(gift_input: GiftInput, law: LawContext) -> GiftBreakdown:
         residency_key = gift_input.residency_status
         relationship_key = gift_input.relationship
 
-        basic_table = law.data.get("basic_deduction", {})
-        try:
-            basic_deduction_limit = Decimal(
-                str(basic_table[residency_key][relationship_key])
-            )
-        except KeyError:
+        limit = law.basic_deductions.get((residency_key, relationship_key))
+        if limit is None:
             notes.append(
                 "법규 테이블에 해당 거주자 구분/관계의 기본공제가 정의되어 있지 않습니다."
             )
@@ -206,44 +368,39 @@ def compute_tax(gift_input: GiftInput, law: LawContext) -> GiftBreakdown:
                 tax_due=tax_due,
                 notes=notes,
             )
+        basic_deduction_limit = limit
 
         prior_gifts_adjustment = min(prior_gifts_adjustment, basic_deduction_limit)
         basic_deduction_applied = basic_deduction_limit - prior_gifts_adjustment
         if basic_deduction_applied < 0:
-            basic_deduction_applied = Decimal("0")
-
-        taxable_base = net_gift - basic_deduction_applied
-        if taxable_base < 0:
-            taxable_base = Decimal("0")
-
-        if taxable_base == 0:
-            tax_due = Decimal("0")
+            basic_deduction_applied = 0
+
+        # taxable_base stays 0 unless the net gift exceeds the applied deduction.
+        if net_gift == 0:
+            # The net gift is zero: skip the taxable base arithmetic and bracket lookup.
+            tax_due = 0
+            notes.append("순증여재산가액이 0원이므로 납부할 증여세가 없습니다.")
+        elif net_gift <= basic_deduction_applied:
+            tax_due = 0
         else:
-            bracket = _find_progressive_bracket(law.data.get("progressive_rates", []), taxable_base)
+            taxable_base = net_gift - basic_deduction_applied
+            bracket = _find_progressive_bracket(law, taxable_base)
             if bracket is None:
                 notes.append("법규 테이블의 누진세율 구간을 찾을 수 없습니다.")
                 tax_due = None
             else:
-                applied_rate = bracket["rate"]
-                progressive_deduction = bracket.get("deduction", Decimal("0"))
-                raw_tax = taxable_base * applied_rate
-                tax_due = raw_tax - progressive_deduction
-                if tax_due < 0:
-                    tax_due = Decimal("0")
-                tax_due = tax_due.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+                applied_rate = bracket.rate
+                progressive_deduction = bracket.deduction
+                tax_due = _progressive_tax(bracket, taxable_base)
+                rate_pct = applied_rate * 100
                 notes.append(
-                    "과세표준 {base:,}원에 세율 {rate}% 및 누진공제 {deduction:,}원을 적용했습니다.".format(
-                        base=int(taxable_base),
-                        rate=(applied_rate * Decimal("100")),
-                        deduction=int(progressive_deduction),
-                    )
+                    f"과세표준 {taxable_base:,}원에 세율 {rate_pct}% "
+                    f"및 누진공제 {progressive_deduction:,}원을 적용했습니다."
                 )
 
         if gift_input.prior_gifts:
             notes.append(
-                "최근 10년 내 증여가액 {amount:,}원이 기본공제 한도를 차감했습니다.".format(
-                    amount=int(gift_input.prior_gifts or Decimal("0"))
-                )
+                f"최근 10년 내 증여가액 {gift_input.prior_gifts:,}원이 기본공제 한도를 차감했습니다."
             )
 
     return GiftBreakdown(
@@ -271,6 +428,7 @@ def compute_tax(gift_input: GiftInput, law: LawContext) -> GiftBreakdown:
 
 
 __all__ = [
+    "FormError",
     "GiftInput",
     "GiftBreakdown",
     "LawContext",
@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import app as gift_app
+
+
+@pytest.fixture()
+def client():
+    return gift_app.app.test_client()
+
+
+def make_form(**overrides):
+    base = {
+        "recipient_name": "홍길동",
+        "gift_date": "2025-02-10",
+        "relationship": "lineal_descendant_adult",
+        "residency_status": "resident",
+        "property_type": "cash",
+        "property_value": "150000000",
+        "debt_assumed": "",
+        "prior_gifts": "",
+    }
+    base.update(overrides)
+    return base
+
+
+def test_blank_form_is_rendered_and_cached(client):
+    first = client.get("/")
+    second = client.get("/")
+
+    assert first.status_code == 200
+    assert second.get_data() == first.get_data()
+    assert gift_app._EMPTY_FORM_HTML == first.get_data(as_text=True)
+
+
+def test_successful_post_renders_result(client):
+    response = client.post("/calc", data=make_form())
+    body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert "과세표준 계산 결과" in body
+    assert "100,000,000" in body
+    assert "10,000,000" in body
+
+
+def test_invalid_post_lists_errors_and_echoes_values(client):
+    response = client.post(
+        "/calc",
+        data={"recipient_name": "홍길동", "relationship": "spouse", "property_value": "-3"},
+    )
+    body = response.get_data(as_text=True)
+
+    assert response.status_code == 400
+    assert "<li>gift_date: YYYY-MM-DD 형식으로 입력해 주세요.</li>" in body
+    assert "<li>residency_status: 값을 입력해 주세요.</li>" in body
+    assert "<li>property_value: 0 이상의 값을 입력해 주세요.</li>" in body
+    assert 'value="홍길동"' in body
+    assert 'value="-3"' in body
+    assert '<option value="spouse" selected>' in body
@@ -6,7 +6,8 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from gift_tax.calculator import GiftInput, compute_tax, load_law_table
+from gift_tax import calculator
+from gift_tax.calculator import FormError, GiftInput, compute_tax, load_law_table
 
 
 @pytest.fixture(scope="module")
@@ -27,16 +28,16 @@ def make_input(**overrides) -> GiftInput:
         "prior_gifts": Decimal("0"),
     }
     base.update(overrides)
-    return GiftInput(**base)
+    return GiftInput.from_form(base)
 
 
 def test_basic_deduction_zero_tax_adult_descendant(law_context):
     gift_input = make_input(property_value=Decimal("50000000"))
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.taxable_base == Decimal("0")
-    assert breakdown.tax_due == Decimal("0")
-    assert breakdown.basic_deduction == Decimal("50000000")
+    assert breakdown.taxable_base == 0
+    assert breakdown.tax_due == 0
+    assert breakdown.basic_deduction == 50000000
     assert breakdown.law_configured is True
 
 
@@ -44,8 +45,10 @@ def test_tax_at_first_bracket_ceiling(law_context):
     gift_input = make_input(property_value=Decimal("150000000"))
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.taxable_base == Decimal("100000000")
-    assert breakdown.tax_due == Decimal("10000000")
+    assert breakdown.taxable_base == 100000000
+    assert breakdown.tax_due == 10000000
+    assert type(breakdown.taxable_base) is int
+    assert type(breakdown.tax_due) is int
     assert breakdown.applied_rate == Decimal("0.1")
 
 
@@ -53,10 +56,10 @@ def test_second_bracket_progressive_deduction(law_context):
     gift_input = make_input(property_value=Decimal("160000000"))
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.taxable_base == Decimal("110000000")
+    assert breakdown.taxable_base == 110000000
     assert breakdown.applied_rate == Decimal("0.2")
-    assert breakdown.progressive_deduction == Decimal("10000000")
-    assert breakdown.tax_due == Decimal("12000000")
+    assert breakdown.progressive_deduction == 10000000
+    assert breakdown.tax_due == 12000000
 
 
 def test_spouse_high_value_falls_into_fourth_bracket(law_context):
@@ -66,10 +69,10 @@ def test_spouse_high_value_falls_into_fourth_bracket(law_context):
     )
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.basic_deduction == Decimal("600000000")
-    assert breakdown.taxable_base == Decimal("2900000000")
+    assert breakdown.basic_deduction == 600000000
+    assert breakdown.taxable_base == 2900000000
     assert breakdown.applied_rate == Decimal("0.4")
-    assert breakdown.tax_due == Decimal("1000000000")
+    assert breakdown.tax_due == 1000000000
 
 
 def test_minor_with_prior_gifts_reduces_deduction(law_context):
@@ -80,10 +83,10 @@ def test_minor_with_prior_gifts_reduces_deduction(law_context):
     )
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.basic_deduction_limit == Decimal("20000000")
-    assert breakdown.prior_gifts_adjustment == Decimal("5000000")
-    assert breakdown.basic_deduction == Decimal("15000000")
-    assert breakdown.tax_due == Decimal("1500000")
+    assert breakdown.basic_deduction_limit == 20000000
+    assert breakdown.prior_gifts_adjustment == 5000000
+    assert breakdown.basic_deduction == 15000000
+    assert breakdown.tax_due == 1500000
 
 
 def test_prior_gifts_exceed_basic_deduction(law_context):
@@ -93,9 +96,9 @@ def test_prior_gifts_exceed_basic_deduction(law_context):
     )
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.basic_deduction == Decimal("0")
-    assert breakdown.prior_gifts_adjustment == Decimal("50000000")
-    assert breakdown.tax_due == Decimal("4000000")
+    assert breakdown.basic_deduction == 0
+    assert breakdown.prior_gifts_adjustment == 50000000
+    assert breakdown.tax_due == 4000000
 
 
 def test_debt_reduces_net_to_zero(law_context):
@@ -105,9 +108,11 @@ def test_debt_reduces_net_to_zero(law_context):
     )
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.net_gift == Decimal("0")
-    assert breakdown.taxable_base == Decimal("0")
-    assert breakdown.tax_due == Decimal("0")
+    assert breakdown.net_gift == 0
+    assert breakdown.taxable_base == 0
+    assert breakdown.tax_due == 0
+    assert breakdown.applied_rate is None
+    assert breakdown.notes == ["순증여재산가액이 0원이므로 납부할 증여세가 없습니다."]
 
 
 def test_non_resident_others_deduction(law_context):
@@ -118,7 +123,87 @@ def test_non_resident_others_deduction(law_context):
     )
     breakdown = compute_tax(gift_input, law_context)
 
-    assert breakdown.basic_deduction_limit == Decimal("10000000")
-    assert breakdown.taxable_base == Decimal("50000000")
-    assert breakdown.tax_due == Decimal("5000000")
+    assert breakdown.basic_deduction_limit == 10000000
+    assert breakdown.taxable_base == 50000000
+    assert breakdown.tax_due == 5000000
     assert breakdown.law_version == "2025-01-01"
+
+
+def test_placeholder_table_is_not_configured(tmp_path):
+    law_path = tmp_path / "placeholder.yaml"
+    law_path.write_text(
+        "basic_deduction:\n  resident:\n    spouse: PLACEHOLDER\n", encoding="utf-8"
+    )
+    law = load_law_table(law_path)
+
+    assert law.configured is False
+    breakdown = compute_tax(make_input(property_value=Decimal("10000000")), law)
+    assert breakdown.law_configured is False
+    assert breakdown.tax_due is None
+
+
+def test_law_table_cached_until_file_changes(tmp_path):
+    law_path = tmp_path / "law.yaml"
+    law_path.write_text(
+        "basic_deduction:\n  resident:\n    spouse: 600000000\n", encoding="utf-8"
+    )
+    first = load_law_table(law_path)
+
+    assert load_law_table(law_path) is first
+    assert first.basic_deductions[("resident", "spouse")] == 600000000
+    assert type(first.basic_deductions[("resident", "spouse")]) is int
+
+    law_path.write_text(
+        "basic_deduction:\n  resident:\n    spouse: 1000000000\n", encoding="utf-8"
+    )
+    reloaded = load_law_table(law_path)
+
+    assert reloaded is not first
+    assert reloaded.basic_deductions[("resident", "spouse")] == 1000000000
+    cache_key = str(law_path.resolve())
+    assert [key for key in calculator._LAW_CACHE if cache_key in str(key)] == [cache_key]
+    assert calculator._LAW_CACHE[cache_key][2] is reloaded
+
+
+def test_from_form_reports_every_invalid_field():
+    with pytest.raises(FormError) as exc_info:
+        GiftInput.from_form(
+            {
+                "recipient_name": "  ",
+                "gift_date": "not-a-date",
+                "relationship": "spouse",
+                "residency_status": "resident",
+                "property_type": "cash",
+                "property_value": "-1",
+                "debt_assumed": "abc",
+            }
+        )
+
+    fields = {loc[0] for loc, _msg in exc_info.value.errors}
+    assert fields == {"recipient_name", "gift_date", "property_value", "debt_assumed"}
+
+
+def test_amounts_are_whole_won_and_tax_rounds_half_up(law_context):
+    gift_input = make_input(property_value="50000005.9")
+    breakdown = compute_tax(gift_input, law_context)
+
+    assert gift_input.property_value == 50000005
+    assert breakdown.taxable_base == 5
+    assert breakdown.tax_due == 1
+
+
+@pytest.mark.parametrize("value", ["1e1000000", "10000000000000000"])
+def test_from_form_rejects_out_of_range_amount(value):
+    with pytest.raises(FormError) as exc_info:
+        make_input(property_value=value)
+
+    assert exc_info.value.errors == [
+        (("property_value",), "9,999,999,999,999,999원 이하의 값을 입력해 주세요.")
+    ]
+
+
+def test_from_form_accepts_zero_with_exponent_and_limit_minus_one():
+    gift_input = make_input(property_value="9999999999999999", debt_assumed="0E+100")
+
+    assert gift_input.debt_assumed == 0
+    assert gift_input.property_value == 9999999999999999